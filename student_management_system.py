@@ -1,48 +1,139 @@
 import os
 import json
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, filedialog
 import csv
-import time  # For simulating progress
+import itertools
+import queue
+import threading
+
+try:
+    import orjson  # Optional, much faster (de)serialization of the data file
+except ImportError:
+    orjson = None
 
 class Student:
+    _next_seq = itertools.count()
+
     def __init__(self, id, name, age, grade):
         self.id = id
         self.name = name
         self.age = age
         self.grade = grade
+        self._seq = next(Student._next_seq)  # Creation order, used to order search hits like the list itself
+        self._refresh_cache()
+
+    def _refresh_cache(self):
+        # Must be called whenever a field changes, since display and search use these cached values
+        # Newline separator keeps a query from matching across the ID/name boundary
+        self._search_blob = f"{self.id}\n{self.name}".lower()
+        self._good_grade = self.grade.upper() in ["A", "B"]
+        self._name_lower = self.name.lower()
+        self._grade_lower = self.grade.lower()
 
     def to_dict(self):
         return {"id": self.id, "name": self.name, "age": self.age, "grade": self.grade}
 
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+SORT_KEYS = {
+    "id": lambda s: s.id,
+    "name": lambda s: s._name_lower,
+    "age": lambda s: s.age,
+    "grade": lambda s: s._grade_lower,
+}
+
 class StudentManagementSystem:
-    def __init__(self, filename="students.json"):
+    def __init__(self, filename="students.json", root=None):
         self.filename = filename
+        self.root = root  # Used to debounce saves; without it every change is saved immediately
         self.students = []
+        self._by_id = {}
+        self._trigram_index = {}
+        self._sorted_cache = {}
+        self._mut_version = 0  # Bumped on every change to invalidate _sorted_cache
+        self._dirty = False
+        self._save_after_id = None
         self.load_students()
 
     def load_students(self):
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r') as f:
-                    data = json.load(f)
-                    self.students = [Student(**s) for s in data]
-            except json.JSONDecodeError:
+                with open(self.filename, 'rb') as f:
+                    raw = f.read()
+                data = self._loads(raw)
+                self.students = [Student(**s) for s in data]
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
                 messagebox.showerror("Error", "Corrupted data file. Starting fresh.")
                 self.students = []
+        self._by_id = {s.id: s for s in self.students}
+        self._mut_version += 1
+        self._trigram_index = {}
+        for s in self.students:
+            self._index_student(s)
+
+    def _index_student(self, s):
+        for t in trigrams(s._search_blob):
+            self._trigram_index.setdefault(t, set()).add(s.id)
+
+    def _unindex_student(self, s):
+        for t in trigrams(s._search_blob):
+            ids = self._trigram_index.get(t)
+            if ids is not None:
+                ids.discard(s.id)
+                if not ids:
+                    del self._trigram_index[t]
 
     def save_students(self):
+        tmp_path = self.filename + ".tmp"
         try:
-            with open(self.filename, 'w') as f:
-                json.dump([s.to_dict() for s in self.students], f, indent=4)
+            data = [s.to_dict() for s in self.students]
+            with open(tmp_path, 'wb') as f:
+                f.write(self._dumps(data))
+            os.replace(tmp_path, self.filename)  # Atomic, so a crash never leaves a half-written file
+            self._dirty = False
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {e}")
 
+    def _loads(self, raw):
+        if orjson:
+            data = orjson.loads(raw)
+            # orjson reads integers beyond 64 bits as floats, so reparse those files with the stdlib json module
+            if not any(isinstance(s, dict) and isinstance(s.get("age"), float) for s in data):
+                return data
+        return json.loads(raw)
+
+    def _dumps(self, data):
+        if orjson:
+            try:
+                return orjson.dumps(data)
+            except orjson.JSONEncodeError:
+                pass  # Integers beyond 64 bits, which the stdlib json module handles
+        return json.dumps(data).encode()
+
+    def _schedule_save(self):
+        self._dirty = True
+        if self.root is None:
+            self.flush()
+            return
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self.flush)
+
+    def flush(self):
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._dirty:
+            self.save_students()
+
     def add_student(self, id, name, age, grade):
         if not id or not name or not grade:
             messagebox.showerror("Error", "ID, Name, and Grade are required!")
             return False
-        if any(s.id == id for s in self.students):
+        if id in self._by_id:
             messagebox.showerror("Error", "Student ID already exists!")
             return False
         try:
@@ -52,82 +143,120 @@ class StudentManagementSystem:
         except ValueError:
             messagebox.showerror("Error", "Age must be a positive integer!")
             return False
-        self.students.append(Student(id, name, age, grade))
-        self.save_students()
+        student = Student(id, name, age, grade)
+        self.students.append(student)
+        self._by_id[id] = student
+        self._index_student(student)
+        self._mut_version += 1
+        self._schedule_save()
         return True
 
     def view_students(self, sort_by=None):
-        if sort_by:
-            if sort_by == "id":
-                self.students.sort(key=lambda s: s.id)
-            elif sort_by == "name":
-                self.students.sort(key=lambda s: s.name.lower())
-            elif sort_by == "age":
-                self.students.sort(key=lambda s: s.age)
-            elif sort_by == "grade":
-                self.students.sort(key=lambda s: s.grade.lower())
-        return self.students
-
-    def search_students(self, query):
+        # Returns a cached sorted copy, rebuilt only after the students change; callers must not mutate it
+        key = SORT_KEYS.get(sort_by)
+        if key is None:
+            return self.students
+        cached = self._sorted_cache.get(sort_by)
+        if cached is None or cached[0] != self._mut_version:
+            cached = (self._mut_version, sorted(self.students, key=key))
+            self._sorted_cache[sort_by] = cached
+        return cached[1]
+
+    def search_students(self, query, sort_by=None):
         query = query.lower()
-        return [s for s in self.students if query in s.id.lower() or query in s.name.lower()]
+        if len(query) < 3:
+            results = [s for s in self.students if query in s._search_blob]
+            return self._sort_results(results, sort_by)
+        postings = []
+        for t in trigrams(query):
+            ids = self._trigram_index.get(t)
+            if not ids:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        smallest, rest = postings[0], postings[1:]
+        results = []
+        for id in smallest:
+            if all(id in ids for ids in rest):
+                s = self._by_id[id]
+                if query in s._search_blob:  # Trigrams can match out of order
+                    results.append(s)
+        # Set iteration order is arbitrary, so restore list order before the stable sort by key
+        results.sort(key=lambda s: s._seq)
+        return self._sort_results(results, sort_by)
+
+    def _sort_results(self, results, sort_by):
+        key = SORT_KEYS.get(sort_by)
+        if key is not None:
+            results.sort(key=key)
+        return results
 
     def update_student(self, id, name=None, age=None, grade=None):
-        for s in self.students:
-            if s.id == id:
-                if name: s.name = name
-                if age:
-                    try:
-                        age = int(age)
-                        if age <= 0: raise ValueError
-                        s.age = age
-                    except ValueError:
-                        messagebox.showerror("Error", "Age must be a positive integer!")
-                        return False
-                if grade: s.grade = grade
-                self.save_students()
-                return True
-        messagebox.showerror("Error", "Student not found!")
-        return False
+        s = self._by_id.get(id)
+        if s is None:
+            messagebox.showerror("Error", "Student not found!")
+            return False
+        if age:
+            try:
+                age = int(age)
+                if age <= 0: raise ValueError
+            except ValueError:
+                messagebox.showerror("Error", "Age must be a positive integer!")
+                return False
+        self._unindex_student(s)
+        if name: s.name = name
+        if age: s.age = age
+        if grade: s.grade = grade
+        s._refresh_cache()
+        self._index_student(s)
+        self._mut_version += 1
+        self._schedule_save()
+        return True
 
     def delete_student(self, id):
-        for s in self.students:
-            if s.id == id:
-                self.students.remove(s)
-                self.save_students()
-                return True
-        messagebox.showerror("Error", "Student not found!")
-        return False
+        s = self._by_id.pop(id, None)
+        if s is None:
+            messagebox.showerror("Error", "Student not found!")
+            return False
+        self.students.remove(s)
+        self._unindex_student(s)
+        self._mut_version += 1
+        self._schedule_save()
+        return True
 
     def clear_all_students(self):
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all students?"):
             self.students = []
-            self.save_students()
+            self._by_id = {}
+            self._trigram_index = {}
+            self._mut_version += 1
+            self._schedule_save()
             return True
         return False
 
-    def export_to_csv(self, progress_callback):
-        if not self.students:
-            messagebox.showerror("Error", "No students to export!")
-            return
-        file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
-        if file_path:
-            try:
-                with open(file_path, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["ID", "Name", "Age", "Grade"])
-                    for i, s in enumerate(self.students):
-                        writer.writerow([s.id, s.name, s.age, s.grade])
-                        progress_callback((i + 1) / len(self.students) * 100)
-                        time.sleep(0.01)  # Simulate delay for progress demo
-                messagebox.showinfo("Success", "Data exported to CSV!")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export: {e}")
+    def export_to_csv(self, file_path, rows, progress_callback):
+        # Runs on a worker thread, so errors are raised to the caller instead of shown here
+        tmp_path = file_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(["ID", "Name", "Age", "Grade"])
+                total = len(rows)
+                # Write in chunks so the per-row loop stays inside writerows and progress is reported once per chunk
+                for start in range(0, total, 1024):
+                    writer.writerows(rows[start:start + 1024])
+                    progress_callback(min(start + 1024, total) / total * 100)
+            os.replace(tmp_path, file_path)  # Never leave a cut-off CSV at the chosen path
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
 class StudentManagementGUI:
     def __init__(self, root):
-        self.sms = StudentManagementSystem()
+        self.sms = StudentManagementSystem(root=root)
         self.root = root
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.title("Interactive Student Management System")
         self.root.geometry("900x600")
         self.root.configure(bg="#2e2e2e")  # Dark background
@@ -142,10 +271,29 @@ class StudentManagementGUI:
         style.configure("TEntry", fieldbackground="#404040", foreground="#ffffff", insertcolor="#ffffff", font=("Arial", 10))
         style.configure("TCombobox", fieldbackground="#404040", foreground="#ffffff", font=("Arial", 10))
         style.configure("TProgressbar", background="#4a90e2", troughcolor="#404040")
+        self._row_height = tkfont.Font(font=("Arial", 10)).metrics("linespace") + 4
+        style.configure("Treeview", background="#404040", fieldbackground="#404040", foreground="#ffffff", font=("Arial", 10), rowheight=self._row_height)
+        style.map("Treeview", background=[("selected", "#4a90e2")])
+        style.configure("Treeview.Heading", background="#4a90e2", foreground="#ffffff", font=("Arial", 10, "bold"))
 
         # Tooltips
         self.tooltips = {}
 
+        # Pending debounced search, if any
+        self._search_after = None
+
+        # Height of the heading above the first row; an estimate until a row has been drawn
+        self._rows_top = 2 * self._row_height
+
+        # Running CSV export worker, if any, and whether the window should close once it finishes
+        self._export_thread = None
+        self._close_pending = False
+
+        # Student table is virtualized: only the rows in view are inserted into the widget
+        self._row_students = []
+        self._row_offset = 0
+        self._selected_row = None
+
         # Main layout: Left for list/search, Right for sidebar inputs
         main_frame = ttk.Frame(root)
         main_frame.pack(fill="both", expand=True)
@@ -170,15 +318,28 @@ class StudentManagementGUI:
         sort_combo.grid(row=0, column=3, padx=5)
         sort_combo.bind("<<ComboboxSelected>>", lambda e: self.refresh_list())
 
-        # Listbox with dark styling
+        # Student table with dark styling; grade colours come from row tags
         list_frame = ttk.Frame(left_frame)
         list_frame.pack(fill="both", expand=True)
-        self.listbox = tk.Listbox(list_frame, width=60, height=15, font=("Arial", 10), selectmode=tk.SINGLE, bg="#404040", fg="#ffffff", selectbackground="#4a90e2")
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.listbox.yview)
-        self.listbox.config(yscrollcommand=scrollbar.set)
-        self.listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        self.listbox.bind("<<ListboxSelect>>", self.on_select_student)
+        self.tree = ttk.Treeview(list_frame, columns=("id", "name", "age", "grade"), show="headings", selectmode="browse", height=15)
+        for column, text, width in [("id", "ID", 100), ("name", "Name", 220), ("age", "Age", 60), ("grade", "Grade", 60)]:
+            self.tree.heading(column, text=text, command=lambda c=column: self.sort_by_column(c))
+            self.tree.column(column, width=width)
+        self.tree.tag_configure("good", foreground="#00ff00")  # Brighter colors for dark theme
+        self.tree.tag_configure("bad", foreground="#ff4444")
+        self.scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.on_scrollbar)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.bind("<<TreeviewSelect>>", self.on_select_student)
+        self.tree.bind("<Configure>", lambda e: self.render_rows())
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-4))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(4))
+        # Only the visible rows exist in the tree, so keyboard navigation has to move through _row_students
+        self.tree.bind("<Up>", lambda e: self.move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self.move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self.move_selection(-self.page_size()))
+        self.tree.bind("<Next>", lambda e: self.move_selection(self.page_size()))
 
         # Buttons below list
         button_frame = ttk.Frame(left_frame)
@@ -187,8 +348,9 @@ class StudentManagementGUI:
         self.delete_btn.grid(row=0, column=0, padx=5)
         self.create_tooltip(self.delete_btn, "Delete the selected student (Ctrl+D)")
         ttk.Button(button_frame, text="Clear All", command=self.clear_all).grid(row=0, column=1, padx=5)
-        ttk.Button(button_frame, text="Export to CSV", command=self.export_csv).grid(row=0, column=2, padx=5)
-        ttk.Button(button_frame, text="Exit", command=root.quit).grid(row=0, column=3, padx=5)
+        self.export_btn = ttk.Button(button_frame, text="Export to CSV", command=self.export_csv)
+        self.export_btn.grid(row=0, column=2, padx=5)
+        ttk.Button(button_frame, text="Exit", command=self.on_close).grid(row=0, column=3, padx=5)
 
         # Right frame: Sidebar for inputs
         right_frame = ttk.Frame(main_frame, relief="ridge", borderwidth=2)
@@ -239,22 +401,39 @@ class StudentManagementGUI:
 
     def create_tooltip(self, widget, text):
         def show_tooltip(event):
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = ttk.Label(tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1)
-            label.pack()
-            self.tooltips[widget] = tooltip
-            widget.bind("<Leave>", lambda e: tooltip.destroy())
+            tooltip = self.tooltips.get(widget)
+            if tooltip is None:
+                # Created once on first hover, then just hidden and shown again
+                tooltip = tk.Toplevel(widget)
+                tooltip.withdraw()
+                tooltip.wm_overrideredirect(True)
+                label = ttk.Label(tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1)
+                label.pack()
+                self.tooltips[widget] = tooltip
+            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+            tooltip.deiconify()
+
+        def hide_tooltip(event):
+            tooltip = self.tooltips.get(widget)
+            if tooltip is not None:
+                tooltip.withdraw()
 
         widget.bind("<Enter>", show_tooltip)
+        widget.bind("<Leave>", hide_tooltip)
 
     def live_search(self, event):
+        # Only search once typing pauses instead of on every keystroke
+        if self._search_after:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(120, self._do_search)
+
+    def _do_search(self):
+        self._search_after = None
         query = self.search_var.get()
         if query:
-            results = self.sms.search_students(query)
+            results = self.sms.search_students(query, self.sort_var.get())
         else:
-            results = self.sms.view_students()
+            results = self.sms.view_students(self.sort_var.get())
         self.update_listbox(results)
 
     def refresh_list(self):
@@ -263,29 +442,105 @@ class StudentManagementGUI:
         self.update_buttons()
 
     def update_listbox(self, students):
-        self.listbox.delete(0, tk.END)
-        for s in students:
-            color = "#00ff00" if s.grade.upper() in ["A", "B"] else "#ff4444"  # Brighter colors for dark theme
-            self.listbox.insert(tk.END, f"ID: {s.id} | Name: {s.name} | Age: {s.age} | Grade: {s.grade}")
-            self.listbox.itemconfig(tk.END, {'fg': color})
+        self._row_students = students
+        self._row_offset = 0
+        self._selected_row = None
+        self.render_rows()
+
+    def visible_row_count(self):
+        height = self.tree.winfo_height()
+        if height <= 1:  # Not mapped yet
+            return int(self.tree.cget("height"))
+        # Measure where rows start from the first rendered row, since the heading is taller than a row
+        children = self.tree.get_children()
+        if children:
+            bbox = self.tree.bbox(children[0])
+            if bbox:
+                self._rows_top = bbox[1]
+        # Count only fully visible rows, leaving room for the bottom border, so the last row can always be scrolled to
+        return max(1, (height - self._rows_top - 2) // self._row_height)
+
+    def render_rows(self):
+        visible = self.visible_row_count()
+        total = len(self._row_students)
+        self._row_offset = max(0, min(self._row_offset, total - visible))
+        start, stop = self._row_offset, min(self._row_offset + visible, total)
+        rows = self._row_students[start:stop]
+        self.tree.delete(*self.tree.get_children())
+        # Item ids are the student's absolute row index, so selection maps straight back to it
+        for i, s in enumerate(rows, start):
+            self.tree.insert("", "end", iid=str(i), values=(s.id, s.name, s.age, s.grade), tags=("good" if s._good_grade else "bad",))
+        if self._selected_row is not None and start <= self._selected_row < stop:
+            self.tree.selection_set(str(self._selected_row))
+        if total:
+            self.scrollbar.set(start / total, stop / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_rows(self, delta):
+        self._row_offset += delta
+        self.render_rows()
+        return "break"  # Rows are swapped in place, so skip the tree's own scrolling
+
+    def on_mousewheel(self, event):
+        # One wheel notch is a delta of 120; scroll 4 rows per notch like the stock Tk bindings
+        notches = int(event.delta / 120) or (1 if event.delta > 0 else -1)
+        return self.scroll_rows(-notches * 4)
+
+    def on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._row_offset = int(float(value) * len(self._row_students))
+            self.render_rows()
+        elif action == "scroll":
+            step = int(value)
+            if unit == "pages":
+                step *= self.page_size()
+            self.scroll_rows(step)
+
+    def page_size(self):
+        return max(1, self.visible_row_count() - 1)
+
+    def move_selection(self, delta):
+        total = len(self._row_students)
+        if total:
+            if self._selected_row is None:
+                index = self._row_offset if delta > 0 else min(self._row_offset + self.visible_row_count(), total) - 1
+            else:
+                index = max(0, min(self._selected_row + delta, total - 1))
+            self.select_row(index)
+        return "break"  # Skip the tree's own navigation, which stops at the rendered rows
+
+    def select_row(self, index):
+        self._selected_row = index
+        visible = self.visible_row_count()
+        if index < self._row_offset:
+            self._row_offset = index
+        elif index >= self._row_offset + visible:
+            self._row_offset = index - visible + 1
+        self.render_rows()
+        s = self._row_students[index]
+        self.id_var.set(s.id)
+        self.name_var.set(s.name)
+        self.age_var.set(s.age)
+        self.grade_var.set(s.grade)
+        self.update_buttons()
+
+    def sort_by_column(self, column):
+        self.sort_var.set(column)
+        self.refresh_list()
 
     def update_buttons(self):
-        selected = self.listbox.curselection()
-        state = "normal" if selected else "disabled"
+        state = "normal" if self._selected_row is not None else "disabled"
         self.delete_btn.config(state=state)
         self.update_btn.config(state=state)
 
     def on_select_student(self, event):
-        selected = self.listbox.curselection()
+        selected = self.tree.selection()
         if selected:
-            index = selected[0]
-            student_text = self.listbox.get(index)
-            parts = student_text.split(" | ")
-            self.id_var.set(parts[0].split(": ")[1])
-            self.name_var.set(parts[1].split(": ")[1])
-            self.age_var.set(parts[2].split(": ")[1])
-            self.grade_var.set(parts[3].split(": ")[1])
-            self.update_buttons()
+            index = int(selected[0])
+            if index == self._selected_row:  # Re-selected after scrolling back into view
+                return
+            self.select_row(index)
 
     def add_student(self):
         id = self.id_var.get()
@@ -299,8 +554,7 @@ class StudentManagementGUI:
             self.id_entry.focus()
 
     def update_student(self):
-        selected = self.listbox.curselection()
-        if not selected: return
+        if self._selected_row is None: return
         id = self.id_var.get()
         name = self.name_var.get()
         age = self.age_var.get()
@@ -313,11 +567,8 @@ class StudentManagementGUI:
                 self.id_entry.focus()
 
     def delete_student(self):
-        selected = self.listbox.curselection()
-        if not selected: return
-        index = selected[0]
-        student_text = self.listbox.get(index)
-        id = student_text.split(" | ")[0].split(": ")[1]
+        if self._selected_row is None: return
+        id = self._row_students[self._selected_row].id
         if messagebox.askyesno("Confirm", "Delete this student?"):
             if self.sms.delete_student(id):
                 self.refresh_list()
@@ -336,13 +587,66 @@ class StudentManagementGUI:
             self.clear_fields()
             self.status_var.set("All students cleared!")
 
+    def on_close(self):
+        if self._export_thread is not None and self._export_thread.is_alive():
+            # The worker is a daemon thread, so close once it finishes instead of killing it mid-write
+            if not self._close_pending:
+                self._close_pending = True
+                self.status_var.set("Finishing CSV export before exiting...")
+                return
+            if not messagebox.askyesno("Confirm", "The CSV export is still running. Exit anyway?"):
+                return
+        self.sms.flush()  # Write out any pending debounced save before exiting
+        self.root.destroy()
+
     def export_csv(self):
-        def progress_callback(value):
-            self.progress['value'] = value
-            self.root.update_idletasks()
-        self.progress['value'] = 0
-        self.sms.export_to_csv(progress_callback)
-        self.progress['value'] = 0
+        if not self.sms.students:
+            messagebox.showerror("Error", "No students to export!")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if file_path:
+            # Write on a worker thread so the UI stays responsive; it reports back through a queue
+            self._export_queue = queue.Queue()
+            # Copy the values here on the Tk thread so edits during the export can't race the worker
+            rows = [(s.id, s.name, s.age, s.grade) for s in self.sms.view_students(self.sort_var.get())]
+            self._export_thread = threading.Thread(target=self._export_worker, args=(file_path, rows, self._export_queue), daemon=True)
+            self._export_thread.start()
+            self.export_btn.config(state="disabled")
+            self.progress['value'] = 0
+            self.status_var.set("Exporting to CSV...")
+            self.root.after(50, self._poll_progress)
+
+    def _export_worker(self, file_path, rows, q):
+        # Must not touch Tk from here
+        try:
+            self.sms.export_to_csv(file_path, rows, lambda value: q.put(("progress", value)))
+            q.put(("done", None))
+        except Exception as e:
+            q.put(("error", e))
+
+    def _poll_progress(self):
+        try:
+            while True:
+                kind, value = self._export_queue.get_nowait()
+                if kind == "progress":
+                    self.progress['value'] = value
+                    continue
+                self.progress['value'] = 0
+                self.export_btn.config(state="normal")
+                self._export_thread = None  # Its work is done even if the thread hasn't quite exited yet
+                if kind == "done":
+                    self.status_var.set("Data exported to CSV!")
+                    if not self._close_pending:
+                        messagebox.showinfo("Success", "Data exported to CSV!")
+                else:
+                    self.status_var.set("Export failed!")
+                    messagebox.showerror("Error", f"Failed to export: {value}")
+                if self._close_pending:
+                    self.on_close()
+                return
+        except queue.Empty:
+            pass
+        self.root.after(50, self._poll_progress)
 
 if __name__ == "__main__":
     root = tk.Tk()